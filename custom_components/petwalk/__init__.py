@@ -33,9 +33,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN][entry.entry_id] = entry.data
 
     # Initialize our Coordinator
-    coordinator = hass.data[DOMAIN][COORDINATOR] = hass.data[DOMAIN].get(
-        COORDINATOR, PetwalkCoordinator(hass, entry)
-    )
+    if (coordinator := hass.data[DOMAIN].get(COORDINATOR)) is None:
+        coordinator = hass.data[DOMAIN][COORDINATOR] = PetwalkCoordinator(hass, entry)
+
     await coordinator.initialize()
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -1,6 +1,7 @@
 """Config flow for PetWALK integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -15,7 +16,12 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import CONF_INCLUDE_ALL_EVENTS, DEFAULT_INCLUDE_ALL_EVENTS, DOMAIN
+from .const import (
+    CONF_INCLUDE_ALL_EVENTS,
+    DATA_PENDING_CLIENTS,
+    DEFAULT_INCLUDE_ALL_EVENTS,
+    DOMAIN,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +34,12 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
+# Schema construction is not cheap, so build both variants once
+OPTIONS_SCHEMA = {
+    default: vol.Schema({vol.Optional(CONF_INCLUDE_ALL_EVENTS, default=default): bool})
+    for default in (False, True)
+}
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
@@ -40,12 +52,12 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             username=data[CONF_USERNAME],
             password=data[CONF_PASSWORD],
         )
-        # Test REST API
-        await api.get_system_state()
-        # Test Websocket API
-        device_name = await api.get_device_name()
-        # Test AWS API
-        await api.get_aws_update_info()
+        # Test REST, Websocket and AWS API concurrently
+        _, device_name, _ = await asyncio.gather(
+            api.get_system_state(),
+            api.get_device_name(),
+            api.get_aws_update_info(),
+        )
     except TimeoutError as err:
         _LOGGER.warning(err)
         raise CannotConnectTimeout from err
@@ -59,6 +71,11 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         _LOGGER.warning(err)
         raise InvalidAuth from err
 
+    # Keep the authenticated client around, so the coordinator can reuse it
+    hass.data.setdefault(DOMAIN, {}).setdefault(DATA_PENDING_CLIENTS, {})[
+        data[CONF_IP_ADDRESS]
+    ] = api
+
     # Return info that you want to store in the config entry.
     return {"title": device_name}
 
@@ -123,16 +140,11 @@ class OptionsFlowHandler(OptionsFlow):
 
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_INCLUDE_ALL_EVENTS,
-                        default=self.config_entry.options.get(
-                            CONF_INCLUDE_ALL_EVENTS, DEFAULT_INCLUDE_ALL_EVENTS
-                        ),
-                    ): bool
-                }
-            ),
+            data_schema=OPTIONS_SCHEMA[
+                self.config_entry.options.get(
+                    CONF_INCLUDE_ALL_EVENTS, DEFAULT_INCLUDE_ALL_EVENTS
+                )
+            ],
         )
 
 
@@ -8,5 +8,13 @@ MANUFACTURER = "Petwalk Solutions GmbH"
 CONF_INCLUDE_ALL_EVENTS = "include_all_events"
 DEFAULT_INCLUDE_ALL_EVENTS = False
 
+DATA_PENDING_CLIENTS = "_pending_clients"
+
+SPECIES_ICONS = {
+    "cat": "mdi:cat",
+    "dog": "mdi:dog",
+}
+DEFAULT_SPECIES_ICON = "mdi:paw"
+
 COORDINATOR_KEY_API_DATA = "api_data"
 COORDINATOR_KEY_PET_STATUS = "pet_status"
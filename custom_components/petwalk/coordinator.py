@@ -13,8 +13,9 @@ from pypetwalk.exceptions import (
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_IP_ADDRESS, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util.dt import utcnow
@@ -23,6 +24,8 @@ from .const import (
     CONF_INCLUDE_ALL_EVENTS,
     COORDINATOR_KEY_API_DATA,
     COORDINATOR_KEY_PET_STATUS,
+    DATA_PENDING_CLIENTS,
+    DEFAULT_INCLUDE_ALL_EVENTS,
     DOMAIN,
     MANUFACTURER,
 )
@@ -31,12 +34,32 @@ _LOGGER = logging.getLogger(__name__)
 
 UPDATE_INTERVAL = timedelta(seconds=5)
 UPDATE_INTERVAL_DEVICE_TRACKER = timedelta(seconds=120)
+UPDATE_TIMEOUT = 8
+UPDATE_TIMEOUT_PET_STATUS = 15
+DISPATCH_COOLDOWN = 0.35
 
 
 class PetwalkCoordinator(DataUpdateCoordinator):
     """PetWALK Coordinator."""
 
-    last_update_pet_status: datetime | None = None
+    # The HA base classes are not slotted, so instances keep their
+    # __dict__; slotting our own attributes still gives them C-level
+    # descriptor access and keeps the instance dict small.
+    __slots__ = (
+        "_api",
+        "_include_all_events",
+        "_next_pet_status_at",
+        "_changed_contexts",
+        "_dispatch_debouncer",
+        "api_data",
+        "pet_status",
+        "device_name",
+        "device_id",
+        "sw_version",
+        "serial_number",
+        "pets",
+        "device_info",
+    )
 
     def __init__(
         self,
@@ -45,29 +68,57 @@ class PetwalkCoordinator(DataUpdateCoordinator):
     ) -> None:
         """Initialize Coordinator."""
         super().__init__(hass, _LOGGER, name=DOMAIN, update_interval=UPDATE_INTERVAL)
-        self._config = hass.data[DOMAIN][config_entry.entry_id]
+        config = hass.data[DOMAIN][config_entry.entry_id]
+        self._include_all_events = config.get(
+            CONF_INCLUDE_ALL_EVENTS, DEFAULT_INCLUDE_ALL_EVENTS
+        )
 
-        self._api = PyPetWALK(
-            host=self._config[CONF_IP_ADDRESS],
-            username=self._config[CONF_USERNAME],
-            password=self._config[CONF_PASSWORD],
+        host = config[CONF_IP_ADDRESS]
+        # Reuse the client already authenticated by the config flow, if any
+        self._api = hass.data[DOMAIN].get(DATA_PENDING_CLIENTS, {}).pop(
+            host, None
+        ) or PyPetWALK(
+            host=host,
+            username=config[CONF_USERNAME],
+            password=config[CONF_PASSWORD],
+        )
+        self.device_name = ""
+        self.device_id = 0
+        self.sw_version = ""
+        self.serial_number = ""
+        self.pets: list[Pet] = []
+        self.device_info: DeviceInfo = DeviceInfo()
+        self._next_pet_status_at: datetime | None = None
+        # Pre-indexed views for the entity callbacks, so they don't have
+        # to re-probe the generic data dict on every push
+        self.api_data: dict[str, Any] | None = None
+        self.pet_status: dict[str, Any] | None = None
+        # Sections queued for the next listener dispatch; None means all
+        self._changed_contexts: set[str] | None = None
+        # Coalesce dispatch bursts into one pass over the listeners
+        self._dispatch_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=DISPATCH_COOLDOWN,
+            immediate=True,
+            function=self._async_dispatch_listeners,
         )
-        self._device_name = ""
-        self._device_id = 0
-        self._sw_version = ""
-        self._serial_number = ""
-        self._pets: list[Pet] = []
-        self._device_info: DeviceInfo = DeviceInfo()
 
     async def initialize(self):
         """Initialize the integration."""
         try:
-            self.device_name = await self._api.get_device_name()
-            self.device_id = await self._api.get_device_id()
-            self.sw_version = await self._api.get_sw_version()
-            self.serial_number = await self._api.get_serial_number()
-            self.pets = await self._api.get_available_pets(
-                self._config[CONF_INCLUDE_ALL_EVENTS]
+            (
+                self.device_name,
+                self.device_id,
+                self.sw_version,
+                self.serial_number,
+                self.pets,
+            ) = await asyncio.gather(
+                self._api.get_device_name(),
+                self._api.get_device_id(),
+                self._api.get_sw_version(),
+                self._api.get_serial_number(),
+                self._api.get_available_pets(self._include_all_events),
             )
             self.device_info = DeviceInfo(
                 identifiers={(DOMAIN, self.device_name)},
@@ -82,87 +133,110 @@ class PetwalkCoordinator(DataUpdateCoordinator):
         # Fetch initial data, so we have data when entities are subscribed
         await self.async_config_entry_first_refresh()
 
-    @property
-    def device_name(self) -> str:
-        """Return the Device Name."""
-        return self._device_name
-
-    @device_name.setter
-    def device_name(self, device_name: str) -> None:
-        self._device_name = device_name
-
-    @property
-    def device_id(self) -> int:
-        """Return the Device ID."""
-        return self._device_id
-
-    @device_id.setter
-    def device_id(self, device_id: int) -> None:
-        self._device_id = device_id
-
-    @property
-    def sw_version(self) -> str:
-        """Return the Software Version."""
-        return self._sw_version
-
-    @sw_version.setter
-    def sw_version(self, sw_version: str) -> None:
-        self._sw_version = sw_version
-
-    @property
-    def serial_number(self) -> str:
-        """Return the Serial Number."""
-        return self._serial_number
-
-    @serial_number.setter
-    def serial_number(self, serial_number: str) -> None:
-        self._serial_number = serial_number
-
-    @property
-    def pets(self) -> list[Pet]:
-        """Return the event RFID Index."""
-        return self._pets
-
-    @pets.setter
-    def pets(self, pets: list[Pet]) -> None:
-        self._pets = pets
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the Device Information."""
-        return self._device_info
-
-    @device_info.setter
-    def device_info(self, device_info: DeviceInfo) -> None:
-        self._device_info = device_info
-
     async def set_state(self, key: str, value: bool) -> None:
         """Set the state for given key."""
         await self._api.set_state(key, value)
 
+        # Merge the new value right away, so all subscribed entities see it
+        # without waiting for the next fetch
+        if (data := self.data) is not None:
+            api_data = {**data.get(COORDINATOR_KEY_API_DATA, {}), key: value}
+            self.api_data = api_data
+            self._note_changed({COORDINATOR_KEY_API_DATA})
+            self.async_set_updated_data({**data, COORDINATOR_KEY_API_DATA: api_data})
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API."""
+        data: dict[str, Any] = {}
+
+        # To avoid spamming AWS, we have a different update interval for it
+        now = utcnow()
+        fetch_pet_status = (
+            next_at := self._next_pet_status_at
+        ) is None or now >= next_at
+
+        fetched = False
         try:
-            async with asyncio.timeout(10):
-                data = self.data
-                if data is None:
-                    data = {}
-                _LOGGER.debug("Fetching local API Data")
-                data[COORDINATOR_KEY_API_DATA] = await self._api.get_api_data()
-
-                # To avoid spamming AWS, we have a different update interval for it
-                if not (last_update_pet_status := self.last_update_pet_status) or (
-                    utcnow() - last_update_pet_status >= UPDATE_INTERVAL_DEVICE_TRACKER
-                ):
-                    _LOGGER.debug("Fetching Timeline Data from API")
-                    data[COORDINATOR_KEY_PET_STATUS] = await self._api.get_pet_status(
-                        self.device_id
+            if fetch_pet_status:
+                _LOGGER.debug("Fetching local API and Timeline Data from API")
+                # Allow more time when the slower AWS call runs as well
+                async with asyncio.timeout(UPDATE_TIMEOUT_PET_STATUS):
+                    (
+                        data[COORDINATOR_KEY_API_DATA],
+                        data[COORDINATOR_KEY_PET_STATUS],
+                    ) = await asyncio.gather(
+                        self._api.get_api_data(),
+                        self._api.get_pet_status(self.device_id),
                     )
-                    self.last_update_pet_status = utcnow()
-
-                return data
+            else:
+                _LOGGER.debug("Fetching local API Data")
+                async with asyncio.timeout(UPDATE_TIMEOUT):
+                    data[COORDINATOR_KEY_API_DATA] = await self._api.get_api_data()
+            fetched = True
         except (
             PyPetWALKInvalidResponseStatus,
             PyPetWALKClientConnectionError,
         ) as err:
             raise UpdateFailed("Error communication with API") from err
+        finally:
+            if not fetched:
+                # Wake every listener on any failure, including timeouts,
+                # so availability can update
+                self._note_changed(None)
+
+        if fetch_pet_status:
+            self._next_pet_status_at = now + UPDATE_INTERVAL_DEVICE_TRACKER
+        elif (current := self.data) and COORDINATOR_KEY_PET_STATUS in current:
+            # Carry the last pet status forward until its next refresh
+            data[COORDINATOR_KEY_PET_STATUS] = current[COORDINATOR_KEY_PET_STATUS]
+
+        if not self.last_update_success:
+            # Recovering from a failed tick: wake every listener even if
+            # the payloads are unchanged, so availability can flip back
+            self._note_changed(None)
+
+        changed = set()
+        if (api_data := data[COORDINATOR_KEY_API_DATA]) != self.api_data:
+            changed.add(COORDINATOR_KEY_API_DATA)
+            self.api_data = api_data
+        if (pet_status := data.get(COORDINATOR_KEY_PET_STATUS)) is not None:
+            if pet_status != self.pet_status:
+                changed.add(COORDINATOR_KEY_PET_STATUS)
+            self.pet_status = pet_status
+        self._note_changed(changed)
+
+        return data
+
+    @callback
+    def _note_changed(self, sections: set[str] | None) -> None:
+        """Queue sections for the next dispatch; None queues every listener.
+
+        The queue accumulates until the debounced dispatch consumes it, so
+        back-to-back publishes cannot overwrite each other's sections.
+        """
+        if sections is None or self._changed_contexts is None:
+            self._changed_contexts = None
+        else:
+            self._changed_contexts |= sections
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Schedule a debounced dispatch to the listeners."""
+        self.hass.async_create_task(self._dispatch_debouncer.async_call())
+
+    async def _async_dispatch_listeners(self) -> None:
+        """Dispatch to the listeners whose queued context sections changed."""
+        changed = self._changed_contexts
+        self._changed_contexts = set()
+        if changed is None:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled refresh and shut down the dispatch debouncer."""
+        await super().async_shutdown()
+        await self._dispatch_debouncer.async_shutdown()
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
 from pypetwalk.const import API_STATE_DOOR
@@ -16,18 +17,19 @@ from homeassistant.components.cover import (
     CoverEntity,
     CoverEntityFeature,
 )
-from homeassistant.const import STATE_CLOSED, STATE_OPEN
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import COORDINATOR, COORDINATOR_KEY_API_DATA, DOMAIN, NAME
 from .coordinator import PetwalkCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,6 +56,8 @@ async def async_setup_entry(
 class PetWALKDoor(CoordinatorEntity, CoverEntity):
     """PetWALK Cover Entity."""
 
+    __slots__ = ("_api_data_key", "_last_update_success")
+
     _attr_available = False
     _attr_device_class = CoverDeviceClass.DOOR
     _attr_supported_features = CoverEntityFeature.OPEN | CoverEntityFeature.CLOSE
@@ -68,61 +72,79 @@ class PetWALKDoor(CoordinatorEntity, CoverEntity):
         icon: str | None = None,
     ) -> None:
         """Initialize the Door."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=COORDINATOR_KEY_API_DATA)
+
+        self._api_data_key = sys.intern(api_data_key)
+        self._last_update_success = coordinator.last_update_success
 
-        self._state = STATE_CLOSED
-        self._device_name = coordinator.device_name
-        self._name = entity_name
-        self._entity_id = entity_id
-        self._api_data_key = api_data_key
+        device_name = coordinator.device_name
+        self._attr_unique_id = f"{DOMAIN}_{device_name}_{entity_id}"
+        self._attr_name = f"{NAME} {device_name} {entity_name}"
+        self._attr_is_closed = True
 
         if icon is not None:
             self._attr_icon = icon
 
     @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{DOMAIN}_{self._device_name}_{self._entity_id}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return f"{NAME} {self._device_name} {self._name}"
+    def available(self) -> bool:
+        """Return if the entity is available."""
+        return super().available and self._attr_available
 
     @property
     def device_info(self) -> DeviceInfo:
         """Return the device info."""
         return self.coordinator.device_info
 
-    @property
-    def is_closed(self) -> bool:
-        """Return the current entity state."""
-        return bool(self._state == STATE_CLOSED)
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and seed the initial state."""
+        await super().async_added_to_hass()
+        # The coordinator only dispatches on changes, so pick up the
+        # state it already fetched before we were added
+        self._handle_coordinator_update()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if COORDINATOR_KEY_API_DATA in self.coordinator.data:
-            data = self.coordinator.data[COORDINATOR_KEY_API_DATA]
-
-            if self._api_data_key not in data:
-                raise UpdateFailed(
-                    f"Unknown response value {data} for key {self._api_data_key}"
-                )
-
-            if data[self._api_data_key]:
-                self._state = STATE_OPEN
-            else:
-                self._state = STATE_CLOSED
-
-            self.async_write_ha_state()
+        # A success flip changes the visible availability, so it has to
+        # be written out even when the door state is unchanged
+        success = self.coordinator.last_update_success
+        success_changed = success != self._last_update_success
+        self._last_update_success = success
+
+        data = self.coordinator.api_data
+        if data is None:
+            if success_changed:
+                self.async_write_ha_state()
+            return
+
+        state = data.get(self._api_data_key, _MISSING)
+        if state is _MISSING:
+            _LOGGER.warning(
+                "Unknown response value %s for key %s", data, self._api_data_key
+            )
+            if self._attr_available:
+                self._attr_available = False
+                self.async_write_ha_state()
+            return
+
+        new_is_closed = not state
+        if (
+            new_is_closed == self._attr_is_closed
+            and self._attr_available
+            and not success_changed
+        ):
+            return
+
+        self._attr_available = True
+        self._attr_is_closed = new_is_closed
+        self.async_write_ha_state()
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the Cover/Door."""
         try:
             await self.coordinator.set_state(self._api_data_key, True)
 
-            self._state = STATE_OPEN
+            self._attr_is_closed = False
             self._attr_available = True
 
             self.async_write_ha_state()  # PetWALK API is slow, so sync here the state
@@ -134,7 +156,7 @@ class PetWALKDoor(CoordinatorEntity, CoverEntity):
         try:
             await self.coordinator.set_state(self._api_data_key, False)
 
-            self._state = STATE_CLOSED
+            self._attr_is_closed = True
             self._attr_available = True
 
             self.async_write_ha_state()  # PetWALK API is slow, so sync here the state
@@ -2,23 +2,37 @@
 from __future__ import annotations
 
 import logging
+import sys
+from typing import Any
 
+from pypetwalk.aws import Pet
 from pypetwalk.const import EVENT_DIRECTION_IN, EVENT_DIRECTION_OUT
 
 from homeassistant import config_entries
 from homeassistant.components.device_tracker import SourceType, TrackerEntity
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
 
-from .const import COORDINATOR, COORDINATOR_KEY_PET_STATUS, DOMAIN, NAME
+from .const import (
+    COORDINATOR,
+    COORDINATOR_KEY_PET_STATUS,
+    DEFAULT_SPECIES_ICON,
+    DOMAIN,
+    NAME,
+    SPECIES_ICONS,
+)
 from .coordinator import PetwalkCoordinator
+from .entity import PetwalkCoordinatorEntity, pet_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
+_DIRECTION_TO_STATE = {
+    EVENT_DIRECTION_IN: STATE_HOME,
+    EVENT_DIRECTION_OUT: STATE_NOT_HOME,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,46 +43,38 @@ async def async_setup_entry(
     """Set up the switch platform."""
     coordinator: PetwalkCoordinator = hass.data[DOMAIN][COORDINATOR]
 
-    entities = []
-    pets = coordinator.pets
-    if len(pets) > 0:
-        for pet in pets:
-            if pet.unknown:
-                _LOGGER.debug(
-                    "Skipping Unknown pet with id %s and name %s", pet.id, pet.name
-                )
-                continue
-
-            if pet.species and pet.name:
-                entity_id = f"pet_{pet.species.lower()}_{pet.name.lower()}"
-            elif pet.name:
-                entity_id = f"pet_{pet.name.lower()}"
-            else:
-                _LOGGER.warning(
-                    "No Name for %s provided, skipping for addition", pet.id
-                )
-                continue
-
-            entities.append(
-                PetDeviceTracker(
-                    coordinator,
-                    pet_id=pet.id,
-                    species=pet.species,
-                    entity_name=pet.name,
-                    entity_id=entity_id,
-                )
+    _LOGGER.debug("Adding our Pet entities")
+    add_entities(
+        (
+            PetDeviceTracker(
+                coordinator,
+                pet_id=pet.id,
+                species=pet.species,
+                entity_name=pet.name,
+                entity_id=entity_id,
             )
+            for pet in coordinator.pets
+            if (entity_id := _pet_entity_id(pet)) is not None
+        ),
+        True,
+    )
+
+
+def _pet_entity_id(pet: Pet) -> str | None:
+    """Return the entity id for a pet, or None if it should be skipped."""
+    if pet.unknown:
+        _LOGGER.debug("Skipping Unknown pet with id %s and name %s", pet.id, pet.name)
+        return None
 
-    if len(entities) > 0:
-        _LOGGER.debug("Adding our Pet entities")
-        add_entities(entities, True)
+    return pet_entity_id(pet)
 
 
-class PetDeviceTracker(CoordinatorEntity, TrackerEntity):
+class PetDeviceTracker(PetwalkCoordinatorEntity, TrackerEntity):
     """Pet Device Tracker Entity."""
 
-    _attr_available = False
-    _state: str = STATE_NOT_HOME
+    __slots__ = ("_pet_id", "_name")
+
+    _data_section = COORDINATOR_KEY_PET_STATUS
 
     def __init__(
         self,
@@ -81,40 +87,17 @@ class PetDeviceTracker(CoordinatorEntity, TrackerEntity):
         """Initialize the Device Tracker."""
         super().__init__(coordinator)
 
-        self._pet_id = pet_id
-        self._species = species
-        self._device_name = coordinator.device_name
+        self._pet_id = sys.intern(pet_id)
         self._name = entity_name
-        self._entity_id = entity_id
-
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{DOMAIN}_{self._device_name}_{self._entity_id}"
+        self._state = STATE_NOT_HOME
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return f"{NAME} {self._device_name} {self._name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return self.coordinator.device_info
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon of the device."""
-        if not self._species:
-            return "mdi:paw"
-
-        match self._species.lower():
-            case "cat":
-                return "mdi:cat"
-            case "dog":
-                return "mdi:dog"
-            case _:
-                return "mdi:paw"
+        device_name = coordinator.device_name
+        self._attr_unique_id = f"{DOMAIN}_{device_name}_{entity_id}"
+        self._attr_name = f"{NAME} {device_name} {entity_name}"
+        self._attr_device_info = coordinator.device_info
+        self._attr_icon = SPECIES_ICONS.get(
+            (species or "").lower(), DEFAULT_SPECIES_ICON
+        )
 
     @property
     def latitude(self) -> float | None:
@@ -136,27 +119,21 @@ class PetDeviceTracker(CoordinatorEntity, TrackerEntity):
         """Returns the current state."""
         return self._state
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if COORDINATOR_KEY_PET_STATUS in self.coordinator.data:
-            data = self.coordinator.data[COORDINATOR_KEY_PET_STATUS]
-
-            if self._pet_id not in data:
-                raise UpdateFailed(
-                    f"Unable to find current status for {self._name} ({self._pet_id})"
-                )
-
-            event = data[self._pet_id]
-
-            if event.direction == EVENT_DIRECTION_IN:
-                self._state = STATE_HOME
-            elif event.direction == EVENT_DIRECTION_OUT:
-                self._state = STATE_NOT_HOME
-            else:
-                raise UpdateFailed(
-                    f"""Incorrect Direction found for {self._name} ({self._pet_id}):
-                    {event.direction}"""
-                )
-
-            self.async_write_ha_state()
+    def _extract_new_state(self, section: dict[str, Any]) -> str | None:
+        """Return the new location state, or None if unavailable."""
+        event = section.get(self._pet_id)
+        if event is None:
+            _LOGGER.warning(
+                "Unable to find current status for %s (%s)", self._name, self._pet_id
+            )
+            return None
+
+        new_state = _DIRECTION_TO_STATE.get(event.direction)
+        if new_state is None:
+            _LOGGER.warning(
+                "Incorrect Direction found for %s (%s): %s",
+                self._name,
+                self._pet_id,
+                event.direction,
+            )
+        return new_state
@@ -0,0 +1,91 @@
+"""Shared base entity and helpers for the PetWALK entities."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from pypetwalk.aws import Pet
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def pet_entity_id(pet: Pet) -> str | None:
+    """Return the entity id for a pet, or None if it has no name."""
+    name = pet.name and pet.name.lower()
+    if not name:
+        _LOGGER.warning("No Name for %s provided, skipping for addition", pet.id)
+        return None
+
+    if species := pet.species:
+        return "pet_" + species.lower() + "_" + name
+    return "pet_" + name
+
+
+class PetwalkCoordinatorEntity(CoordinatorEntity):
+    """Base entity sharing the coordinator update skeleton."""
+
+    __slots__ = ("_state", "_last_update_success")
+
+    _attr_available = False
+
+    # COORDINATOR_KEY_* section this entity listens on; the keys double
+    # as the matching coordinator attribute names
+    _data_section: str
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the entity with its section as listener context."""
+        super().__init__(coordinator, context=self._data_section)
+        self._last_update_success = coordinator.last_update_success
+
+    @property
+    def available(self) -> bool:
+        """Return if the entity is available."""
+        return super().available and self._attr_available
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the coordinator and seed the initial state."""
+        await super().async_added_to_hass()
+        # The coordinator only dispatches on changes, so pick up the
+        # state it already fetched before we were added
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        # A success flip changes the visible availability, so it has to
+        # be written out even when our own state is unchanged
+        success = self.coordinator.last_update_success
+        success_changed = success != self._last_update_success
+        self._last_update_success = success
+
+        section = getattr(self.coordinator, self._data_section)
+        if section is None:
+            if success_changed:
+                self.async_write_ha_state()
+            return
+
+        new_state = self._extract_new_state(section)
+        if new_state is None:
+            self._set_unavailable()
+            return
+
+        if new_state == self._state and self._attr_available and not success_changed:
+            return
+
+        self._attr_available = True
+        self._state = new_state
+        self.async_write_ha_state()
+
+    def _extract_new_state(self, section: dict[str, Any]) -> Any:
+        """Return the new state from the section, or None if unavailable."""
+        raise NotImplementedError
+
+    @callback
+    def _set_unavailable(self) -> None:
+        """Mark the entity unavailable, writing state only on a change."""
+        if self._attr_available:
+            self._attr_available = False
+            self.async_write_ha_state()
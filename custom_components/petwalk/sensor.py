@@ -3,23 +3,26 @@ from __future__ import annotations
 
 from datetime import datetime
 import logging
+import sys
+from typing import Any
 
 from homeassistant import config_entries
 from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
 
 from .const import (
     CONF_INCLUDE_ALL_EVENTS,
     COORDINATOR,
     COORDINATOR_KEY_PET_STATUS,
+    DEFAULT_SPECIES_ICON,
     DOMAIN,
     NAME,
+    SPECIES_ICONS,
 )
 from .coordinator import PetwalkCoordinator
+from .entity import PetwalkCoordinatorEntity, pet_entity_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,38 +39,29 @@ async def async_setup_entry(
 
     entities = []
     if config[CONF_INCLUDE_ALL_EVENTS]:
-        pets = coordinator.pets
-        if len(pets) > 0:
-            for pet in pets:
-                if pet.species and pet.name:
-                    entity_id = f"pet_{pet.species.lower()}_{pet.name.lower()}"
-                elif pet.name:
-                    entity_id = f"pet_{pet.name.lower()}"
-                else:
-                    _LOGGER.error(
-                        "No Name for %s provided, skipping for addition", pet.id
-                    )
-                    continue
-
-                entities.append(
-                    PetTimestampSensor(
-                        coordinator,
-                        pet_id=pet.id,
-                        species=pet.species,
-                        entity_name=f"{pet.name} last event",
-                        entity_id=entity_id,
-                    )
-                )
-
-    if len(entities) > 0:
+        entities = [
+            PetTimestampSensor(
+                coordinator,
+                pet_id=pet.id,
+                species=pet.species,
+                entity_name=f"{pet.name} last event",
+                entity_id=entity_id,
+            )
+            for pet in coordinator.pets
+            if (entity_id := pet_entity_id(pet)) is not None
+        ]
+
+    if entities:
         _LOGGER.debug("Adding our Pet entities")
         add_entities(entities, True)
 
 
-class PetTimestampSensor(CoordinatorEntity, SensorEntity):
+class PetTimestampSensor(PetwalkCoordinatorEntity, SensorEntity):
     """Pet Sensor Entity."""
 
-    _attr_available = False
+    __slots__ = ("_pet_id", "_name")
+
+    _data_section = COORDINATOR_KEY_PET_STATUS
     _attr_device_class = SensorDeviceClass.TIMESTAMP
     _attr_native_value = None
 
@@ -82,59 +76,31 @@ class PetTimestampSensor(CoordinatorEntity, SensorEntity):
         """Initialize the Device Tracker."""
         super().__init__(coordinator)
 
-        self._pet_id = pet_id
-        self._species = species
-        self._device_name = coordinator.device_name
+        self._pet_id = sys.intern(pet_id)
         self._name = entity_name
-        self._entity_id = entity_id
         self._state = None
 
-    @property
-    def unique_id(self) -> str | None:
-        """Return a unique ID."""
-        return f"{DOMAIN}_{self._device_name}_{self._entity_id}"
+        device_name = coordinator.device_name
+        self._attr_unique_id = f"{DOMAIN}_{device_name}_{entity_id}"
+        self._attr_name = f"{NAME} {device_name} {entity_name}"
+        self._attr_device_info = coordinator.device_info
 
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return f"{NAME} {self._device_name} {self._name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return self.coordinator.device_info
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon of the device."""
-        if not self._species:
-            return "mdi:paw"
-
-        match self._species.lower():
-            case "cat":
-                return "mdi:cat"
-            case "dog":
-                return "mdi:dog"
-            case _:
-                return "mdi:paw"
+        self._attr_icon = SPECIES_ICONS.get(
+            (species or "").lower(), DEFAULT_SPECIES_ICON
+        )
 
     @property
     def state(self) -> datetime | None:
         """Return current state."""
         return self._state
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if COORDINATOR_KEY_PET_STATUS in self.coordinator.data:
-            data = self.coordinator.data[COORDINATOR_KEY_PET_STATUS]
-
-            if self._pet_id not in data:
-                raise UpdateFailed(
-                    f"Unable to find current status for {self._name} ({self._pet_id})"
-                )
-
-            event = data[self._pet_id]
-            self._state = event.date
+    def _extract_new_state(self, section: dict[str, Any]) -> datetime | None:
+        """Return the latest event timestamp, or None if unavailable."""
+        event = section.get(self._pet_id)
+        if event is None:
+            _LOGGER.warning(
+                "Unable to find current status for %s (%s)", self._name, self._pet_id
+            )
+            return None
 
-            self.async_write_ha_state()
+        return event.date
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from typing import Any
 
 from pypetwalk.const import (
@@ -19,17 +20,33 @@ from pypetwalk.exceptions import (
 
 from homeassistant import config_entries
 from homeassistant.components.switch import SwitchDeviceClass, SwitchEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import DiscoveryInfoType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity, UpdateFailed
 
 from .const import COORDINATOR, COORDINATOR_KEY_API_DATA, DOMAIN, NAME
 from .coordinator import PetwalkCoordinator
+from .entity import PetwalkCoordinatorEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# (entity_name, entity_id, api_data_key, icon)
+_SWITCH_SPECS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "Brightness Sensor",
+        "brightness_sensor",
+        API_STATE_BRIGHTNESS_SENSOR,
+        "mdi:brightness-6",
+    ),
+    ("Motion IN", "motion_in", API_STATE_MOTION_IN, "mdi:account-arrow-left"),
+    ("Motion OUT", "motion_out", API_STATE_MOTION_OUT, "mdi:account-arrow-right"),
+    ("RFID", "rfid", API_STATE_RFID, "mdi:nfc-variant"),
+    ("Time", "time", API_STATE_TIME, "mdi:clock-time-eight"),
+    ("System", "system", API_STATE_SYSTEM, "mdi:power"),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -43,56 +60,24 @@ async def async_setup_entry(
     switches = [
         PetWALKSwitch(
             coordinator,
-            entity_name="Brightness Sensor",
-            entity_id="brightness_sensor",
-            api_data_key=API_STATE_BRIGHTNESS_SENSOR,
-            icon="mdi:brightness-6",
-        ),
-        PetWALKSwitch(
-            coordinator,
-            entity_name="Motion IN",
-            entity_id="motion_in",
-            api_data_key=API_STATE_MOTION_IN,
-            icon="mdi:account-arrow-left",
-        ),
-        PetWALKSwitch(
-            coordinator,
-            entity_name="Motion OUT",
-            entity_id="motion_out",
-            api_data_key=API_STATE_MOTION_OUT,
-            icon="mdi:account-arrow-right",
-        ),
-        PetWALKSwitch(
-            coordinator,
-            entity_name="RFID",
-            entity_id="rfid",
-            api_data_key=API_STATE_RFID,
-            icon="mdi:nfc-variant",
-        ),
-        PetWALKSwitch(
-            coordinator,
-            entity_name="Time",
-            entity_id="time",
-            api_data_key=API_STATE_TIME,
-            icon="mdi:clock-time-eight",
-        ),
-        PetWALKSwitch(
-            coordinator,
-            entity_name="System",
-            entity_id="system",
-            api_data_key=API_STATE_SYSTEM,
-            icon="mdi:power",
-        ),
+            entity_name=entity_name,
+            entity_id=entity_id,
+            api_data_key=api_data_key,
+            icon=icon,
+        )
+        for entity_name, entity_id, api_data_key, icon in _SWITCH_SPECS
     ]
 
     add_entities(switches)
 
 
-class PetWALKSwitch(CoordinatorEntity, SwitchEntity):
+class PetWALKSwitch(PetwalkCoordinatorEntity, SwitchEntity):
     """PetWALK Switch Entity."""
 
-    _attr_available = False
+    __slots__ = ("_api_data_key",)
+
     _attr_device_class = SwitchDeviceClass.SWITCH
+    _data_section = COORDINATOR_KEY_API_DATA
 
     def __init__(
         self,
@@ -106,47 +91,31 @@ class PetWALKSwitch(CoordinatorEntity, SwitchEntity):
         super().__init__(coordinator)
 
         self._state = False
-        self._device_name = coordinator.device_name
-        self._name = entity_name
-        self._entity_id = entity_id
-        self._api_data_key = api_data_key
+        self._api_data_key = sys.intern(api_data_key)
+
+        device_name = coordinator.device_name
+        self._attr_unique_id = f"{DOMAIN}_{device_name}_{entity_id}"
+        self._attr_name = f"{NAME} {device_name} {entity_name}"
+        self._attr_device_info = coordinator.device_info
 
         if icon is not None:
             self._attr_icon = icon
 
-    @property
-    def unique_id(self) -> str:
-        """Return a unique ID."""
-        return f"{DOMAIN}_{self._device_name}_{self._entity_id}"
-
-    @property
-    def name(self) -> str:
-        """Return the name of the entity."""
-        return f"{NAME} {self._device_name} {self._name}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return the device info."""
-        return self.coordinator.device_info
-
     @property
     def is_on(self) -> bool:
         """Return the current entity state."""
         return self._state
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        if COORDINATOR_KEY_API_DATA in self.coordinator.data:
-            data = self.coordinator.data[COORDINATOR_KEY_API_DATA]
-
-            if self._api_data_key not in data:
-                raise UpdateFailed(
-                    f"Unknown response value {data} for key {self._api_data_key}"
-                )
+    def _extract_new_state(self, section: dict[str, Any]) -> bool | None:
+        """Return the new switch state, or None if unavailable."""
+        state = section.get(self._api_data_key, _MISSING)
+        if state is _MISSING:
+            _LOGGER.warning(
+                "Unknown response value %s for key %s", section, self._api_data_key
+            )
+            return None
 
-            self._state = data[self._api_data_key]
-            self.async_write_ha_state()
+        return state
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the entity on."""